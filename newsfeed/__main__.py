@@ -47,7 +47,8 @@ def build_parser() -> argparse.ArgumentParser:
         "--limit",
         type=int,
         default=None,
-        help="Optional limit when dumping the archive.",
+        help="Optional limit when dumping the archive; also caps how many of"
+        " the newest entries are considered per poll.",
     )
     parser.add_argument(
         "--log-level",
@@ -60,6 +61,11 @@ def build_parser() -> argparse.ArgumentParser:
         help="Path to a JSONL ledger that mirrors the SQLite archive."
         " Set to an empty string to skip writing.",
     )
+    parser.add_argument(
+        "--rebuild-ledger",
+        action="store_true",
+        help="Rewrite the JSONL ledger from the SQLite archive instead of polling.",
+    )
     return parser
 
 
@@ -70,8 +76,10 @@ def main(argv: list[str] | None = None) -> int:
     load_env()
 
     webhook_url = args.webhook_url or os.getenv("NEWSFEED_WEBHOOK_URL")
-    if not webhook_url and not (args.dump_archive or args.dry_run):
+    if not webhook_url and not (args.dump_archive or args.rebuild_ledger or args.dry_run):
         parser.error("--webhook-url is required (or set NEWSFEED_WEBHOOK_URL).")
+    if args.rebuild_ledger and not args.ledger:
+        parser.error("--rebuild-ledger requires a --ledger path.")
 
     logging.basicConfig(
         level=getattr(logging, args.log_level.upper(), logging.INFO),
@@ -84,6 +92,7 @@ def main(argv: list[str] | None = None) -> int:
         poll_interval=args.interval,
         dry_run=args.dry_run,
         ledger_path=args.ledger or None,
+        item_limit=args.limit,
     )
 
     if args.dump_archive:
@@ -91,6 +100,10 @@ def main(argv: list[str] | None = None) -> int:
             print(line)
         return 0
 
+    if args.rebuild_ledger:
+        service.rebuild_ledger()
+        return 0
+
     if args.once:
         service.run_once()
         return 0
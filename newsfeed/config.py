@@ -2,9 +2,17 @@
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path
 from typing import Iterable
 
+# KEY=value pairs, optionally prefixed with "export" and with the value wrapped
+# in matching single or double quotes. Comments and other lines never match.
+_ENV_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_]\w*)[ \t]*=[ \t]*(["']?)(.*?)\2[ \t]*\r?$""",
+    re.MULTILINE,
+)
+
 
 def load_env(paths: Iterable[str] | None = None) -> None:
     """Populate os.environ with values from .env-style files if present."""
@@ -17,13 +25,5 @@ def load_env(paths: Iterable[str] | None = None) -> None:
         if not path.is_file():
             continue
 
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            os.environ.setdefault(key, value)
+        for match in _ENV_RE.finditer(path.read_text(encoding="utf-8")):
+            os.environ.setdefault(match.group(1), match.group(3))
@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .types import NewsItem
 
@@ -12,6 +15,14 @@ LOGGER = logging.getLogger(__name__)
 
 MAX_EMBEDS_PER_REQUEST = 10
 MAX_DESCRIPTION_LENGTH = 2048
+MAX_CONCURRENT_REQUESTS = 4
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Shared keep-alive session so hourly notifications reuse the connection to
+# Discord; the pool is sized for the concurrent batch posts below.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "MarcelNewsBot/1.0"})
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS))
 
 
 def _chunked(items: list[NewsItem], size: int) -> Iterable[list[NewsItem]]:
@@ -32,25 +43,98 @@ def _build_embed(item: NewsItem) -> dict:
     }
 
 
+def _retry_after(response: requests.Response) -> float:
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            pass
+    try:
+        return float(response.json().get("retry_after", 1.0))
+    except (ValueError, AttributeError):
+        return 1.0
+
+
+def _build_payload(batch: list[NewsItem]) -> dict:
+    return {
+        "username": "Marcel Schneider News",
+        "embeds": [_build_embed(item) for item in batch],
+    }
+
+
+def _post_batch(
+    session: requests.Session, webhook_url: str, payload: dict
+) -> Optional[float]:
+    """Post one webhook payload; return the back-off delay if rate limited."""
+
+    response = session.post(webhook_url, json=payload, timeout=15)
+    if response.status_code == 429:
+        delay = _retry_after(response)
+        LOGGER.warning("Discord rate limit hit, retrying in %.2f seconds.", delay)
+        return delay
+    if response.status_code >= 400:
+        LOGGER.error(
+            "Failed to send news to Discord: status %s, body=%s",
+            response.status_code,
+            response.text,
+        )
+        response.raise_for_status()
+    LOGGER.info("Posted %s news item(s) to Discord.", len(payload["embeds"]))
+    return None
+
+
+def _retry_rate_limited(
+    session: requests.Session, webhook_url: str, payload: dict, delay: Optional[float]
+) -> None:
+    """Re-post a rate-limited payload one at a time, honouring Retry-After."""
+
+    for _ in range(MAX_RATE_LIMIT_RETRIES):
+        if delay is None:
+            return
+        time.sleep(delay)
+        delay = _post_batch(session, webhook_url, payload)
+    if delay is not None:
+        raise requests.HTTPError(
+            f"Discord kept rate limiting after {MAX_RATE_LIMIT_RETRIES} retries."
+        )
+
+
 def send_news(webhook_url: str, items: list[NewsItem]) -> None:
     if not items:
         LOGGER.info("No new items to send to Discord.")
         return
 
-    session = requests.Session()
-    session.headers.update({"User-Agent": "MarcelNewsBot/1.0"})
+    session = _SESSION
+    # Payloads are built once up front and reused for rate-limit retries.
+    payloads = [_build_payload(batch) for batch in _chunked(items, MAX_EMBEDS_PER_REQUEST)]
+
+    # The newest batch goes out on its own first, so the channel starts in
+    # order. Later batches are posted concurrently and may land in any order.
+    first, rest = payloads[0], payloads[1:]
+    _retry_rate_limited(session, webhook_url, first, _post_batch(session, webhook_url, first))
+    if not rest:
+        return
 
-    for batch in _chunked(items, MAX_EMBEDS_PER_REQUEST):
-        payload = {
-            "username": "Marcel Schneider News",
-            "embeds": [_build_embed(item) for item in batch],
+    # Results are collected per batch so one failure does not discard the
+    # retry delays of the others.
+    delays: list[Optional[float]] = [None] * len(rest)
+    failures: list[requests.RequestException] = []
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(rest))) as executor:
+        futures = {
+            executor.submit(_post_batch, session, webhook_url, payload): index
+            for index, payload in enumerate(rest)
         }
-        response = session.post(webhook_url, json=payload, timeout=15)
-        if response.status_code >= 400:
-            LOGGER.error(
-                "Failed to send news to Discord: status %s, body=%s",
-                response.status_code,
-                response.text,
-            )
-            response.raise_for_status()
-        LOGGER.info("Posted %s news item(s) to Discord.", len(batch))
+        for future in as_completed(futures):
+            try:
+                delays[futures[future]] = future.result()
+            except requests.RequestException as exc:
+                failures.append(exc)
+
+    for payload, delay in zip(rest, delays):
+        try:
+            _retry_rate_limited(session, webhook_url, payload, delay)
+        except requests.RequestException as exc:
+            failures.append(exc)
+    if failures:
+        raise failures[0]
@@ -1,30 +1,52 @@
 """Fetching and parsing news from europeantour.com."""
 from __future__ import annotations
 
+import functools
+import heapq
 import json
 import logging
 import random
+import re
+import sys
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urljoin
 
 import cloudscraper
-from bs4 import BeautifulSoup
 
 try:
     from curl_cffi import requests as curl_requests
 except ImportError:  # pragma: no cover - optional dependency at runtime
     curl_requests = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency at runtime
+    orjson = None
+
 from .types import NewsItem
 
 LOGGER = logging.getLogger(__name__)
 BASE_URL = "https://www.europeantour.com"
+
 PLAYER_NEWS_URL = (
     "https://www.europeantour.com/players/marcel-schneider-35703/news?tour=dpworld-tour"
 )
 
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json: lone surrogate escapes, NaN and
+            # out-of-range numbers are rejected, so retry with the stdlib.
+            pass
+    return json.loads(data)
+
+
 _CURL_IMPERSONATIONS = [
     (
         "chrome120",
@@ -55,6 +77,13 @@ _CURL_IMPERSONATIONS = [
     ),
 ]
 
+# The payload is a single inline <script>; scanning the raw response bytes for
+# it avoids building a DOM (or even a decoded str copy) of the whole page.
+_NEXT_DATA_RE = re.compile(
+    rb'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+
 _ACCEPT_LANGUAGES = [
     "en-US,en;q=0.9",
     "en-GB,en;q=0.9,de;q=0.8",
@@ -62,10 +91,47 @@ _ACCEPT_LANGUAGES = [
 ]
 
 
+# Status codes that indicate the bot protection rejected the session itself;
+# these force a fresh session (new fingerprint, cookies and warm-up).
+_CHALLENGE_STATUSES = frozenset({403, 429, 503})
+
+# curl_cffi session shared across polls so the TLS connection and the
+# cookies earned during warm-up survive between fetches.
+_CURL_SESSION: curl_requests.Session | None = None
+_CURL_SESSION_LOCK = threading.Lock()
+
+
+# Response headers remembered between polls to issue conditional requests.
+VALIDATOR_HEADERS = ("etag", "last-modified")
+
+
 class FetchError(RuntimeError):
     """Raised when the news feed cannot be retrieved."""
 
 
+class NotModified(Exception):
+    """Raised when the news page is unchanged since the given validators."""
+
+
+def _conditional_headers(validators: dict[str, str] | None) -> dict[str, str]:
+    if not validators:
+        return {}
+    headers: dict[str, str] = {}
+    if validators.get("etag"):
+        headers["if-none-match"] = validators["etag"]
+    if validators.get("last-modified"):
+        headers["if-modified-since"] = validators["last-modified"]
+    return headers
+
+
+def _response_validators(response: Any) -> dict[str, str]:
+    return {
+        name: response.headers[name]
+        for name in VALIDATOR_HEADERS
+        if response.headers.get(name)
+    }
+
+
 def _build_headers(
     user_agent: str | None = None, client_hints: dict[str, str] | None = None
 ) -> dict[str, str]:
@@ -106,76 +172,135 @@ def _build_scraper() -> cloudscraper.CloudScraper:
     return scraper
 
 
-def _fetch_with_curl_cffi(timeout: int, attempts: int) -> str:
+def _get_curl_session(timeout: int) -> curl_requests.Session:
+    """Return the shared curl_cffi session, creating and warming it on demand.
+
+    Must be called with ``_CURL_SESSION_LOCK`` held.
+    """
+
+    global _CURL_SESSION
+    if _CURL_SESSION is not None:
+        return _CURL_SESSION
+
+    impersonate, user_agent, client_hints = random.choice(_CURL_IMPERSONATIONS)
+    session = curl_requests.Session()
+    try:
+        session.impersonate = impersonate
+        session.headers.update(_build_headers(user_agent, client_hints))
+        session.http2 = True
+        session.timeout = timeout
+        session.verify = True
+        session.proxies = None
+        warmup = session.get(
+            BASE_URL + "/",
+            allow_redirects=True,
+        )
+        if warmup.status_code >= 400:
+            LOGGER.debug(
+                "Warm-up request for %s returned %s",
+                BASE_URL,
+                warmup.status_code,
+            )
+        time.sleep(random.uniform(0.6, 1.4))
+    except Exception:
+        session.close()
+        raise
+    _CURL_SESSION = session
+    return session
+
+
+def _reset_curl_session() -> None:
+    """Drop the shared curl_cffi session so the next fetch negotiates anew."""
+
+    global _CURL_SESSION
+    if _CURL_SESSION is None:
+        return
+    try:
+        _CURL_SESSION.close()
+    except Exception:  # noqa: BLE001 - best effort cleanup
+        LOGGER.debug("Closing curl_cffi session failed", exc_info=True)
+    _CURL_SESSION = None
+
+
+def _fetch_with_curl_cffi(
+    timeout: int, attempts: int, validators: dict[str, str] | None = None
+) -> tuple[bytes, dict[str, str]]:
     if curl_requests is None:  # pragma: no cover - optional dependency path
         raise FetchError("curl_cffi is not available")
 
+    conditional = _conditional_headers(validators)
     last_error: Exception | None = None
-    for attempt in range(1, attempts + 1):
-        impersonate, user_agent, client_hints = random.choice(_CURL_IMPERSONATIONS)
-        headers = _build_headers(user_agent, client_hints)
-        try:
-            with curl_requests.Session() as session:
-                session.impersonate = impersonate
-                session.headers.update(headers)
-                session.http2 = True
-                session.timeout = timeout
-                session.verify = True
-                session.proxies = None
-                warmup = session.get(
-                    BASE_URL + "/",
-                    allow_redirects=True,
-                )
-                if warmup.status_code >= 400:
-                    LOGGER.debug(
-                        "Warm-up request for %s returned %s",
-                        BASE_URL,
-                        warmup.status_code,
-                    )
-                time.sleep(random.uniform(0.6, 1.4))
+    with _CURL_SESSION_LOCK:
+        for attempt in range(1, attempts + 1):
+            try:
+                session = _get_curl_session(timeout)
                 response = session.get(
                     PLAYER_NEWS_URL,
                     allow_redirects=True,
+                    timeout=timeout,
+                    headers=conditional,
                 )
-            if response.status_code >= 400:
-                last_error = FetchError(
-                    f"Failed to retrieve news (status {response.status_code}) from {PLAYER_NEWS_URL}"
-                )
+                if response.status_code == 304:
+                    raise NotModified(PLAYER_NEWS_URL)
+                if response.status_code >= 400:
+                    last_error = FetchError(
+                        f"Failed to retrieve news (status {response.status_code}) from {PLAYER_NEWS_URL}"
+                    )
+                    LOGGER.warning(
+                        "curl_cffi attempt %s/%s blocked with status %s",
+                        attempt,
+                        attempts,
+                        response.status_code,
+                    )
+                    if response.status_code in _CHALLENGE_STATUSES:
+                        _reset_curl_session()
+                else:
+                    return response.content, _response_validators(response)
+            except NotModified:
+                raise
+            except Exception as exc:  # noqa: BLE001 - log and retry
                 LOGGER.warning(
-                    "curl_cffi attempt %s/%s blocked with status %s",
+                    "curl_cffi attempt %s/%s to fetch news failed: %s",
                     attempt,
                     attempts,
-                    response.status_code,
+                    exc,
                 )
-            else:
-                return response.text
-        except Exception as exc:  # noqa: BLE001 - log and retry
-            LOGGER.warning(
-                "curl_cffi attempt %s/%s to fetch news failed: %s",
-                attempt,
-                attempts,
-                exc,
-            )
-            last_error = exc
+                last_error = exc
+                _reset_curl_session()
 
-        if attempt < attempts:
-            time.sleep(random.uniform(2.0, 4.0))
+            if attempt < attempts:
+                time.sleep(random.uniform(2.0, 4.0))
 
     if last_error:
         raise FetchError(str(last_error)) from last_error
     raise FetchError(f"Failed to retrieve news from {PLAYER_NEWS_URL}")
 
 
-def fetch_news_html(timeout: int = 30, attempts: int = 4) -> str:
+def fetch_news_html(
+    timeout: int = 30,
+    attempts: int = 4,
+    validators: dict[str, str] | None = None,
+) -> tuple[bytes, dict[str, str]]:
+    """Return the news page body and the validators for the next request.
+
+    ``validators`` are those returned by a previous call; when the page has
+    not changed since then, :class:`NotModified` is raised instead.
+    """
+
     errors: list[Exception] = []
 
     if curl_requests is not None:
         try:
-            return _fetch_with_curl_cffi(timeout=timeout, attempts=attempts)
+            return _fetch_with_curl_cffi(
+                timeout=timeout, attempts=attempts, validators=validators
+            )
+        except NotModified:
+            raise
         except Exception as exc:  # noqa: BLE001 - capture and fall back
             LOGGER.info("curl_cffi fetch failed, falling back to cloudscraper: %s", exc)
             errors.append(exc)
 
+    conditional = _conditional_headers(validators)
     last_error: Exception | None = None
     backoff = 1.75
     for attempt in range(1, attempts + 1):
@@ -189,7 +314,9 @@ def fetch_news_html(timeout: int = 30, attempts: int = 4) -> str:
                     warmup.status_code,
                 )
             time.sleep(random.uniform(0.5, 1.2))
-            response = scraper.get(PLAYER_NEWS_URL, timeout=timeout)
+            response = scraper.get(PLAYER_NEWS_URL, timeout=timeout, headers=conditional)
+            if response.status_code == 304:
+                raise NotModified(PLAYER_NEWS_URL)
             if response.status_code == 403:
                 LOGGER.warning("Cloudscraper attempt %s/%s blocked by 403 status.", attempt, attempts)
                 last_error = FetchError(
@@ -200,7 +327,9 @@ def fetch_news_html(timeout: int = 30, attempts: int = 4) -> str:
                     f"Failed to retrieve news (status {response.status_code}) from {PLAYER_NEWS_URL}"
                 )
             else:
-                return response.text
+                return response.content, _response_validators(response)
+        except NotModified:
+            raise
         except Exception as exc:  # noqa: BLE001 - log and retry
             LOGGER.warning(
                 "Cloudscraper attempt %s/%s to fetch news failed: %s",
@@ -232,7 +361,15 @@ def _normalise_url(url: str) -> str:
     return url if url.startswith("http") else urljoin(BASE_URL, url)
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_datetime(value: str) -> datetime:
+    # Fast path for the common "2024-05-01T10:00:00Z" shape; fromisoformat is
+    # far cheaper than strptime, which re-interprets its format on every call.
+    if value.endswith("Z") and "T" in value and "." not in value:
+        try:
+            return datetime.fromisoformat(value[:-1])
+        except ValueError:
+            pass
     for fmt in (
         "%Y-%m-%dT%H:%M:%S%z",
         "%Y-%m-%dT%H:%M:%S.%f%z",
@@ -253,12 +390,27 @@ def _parse_datetime(value: str) -> datetime:
         raise ValueError(f"Unable to parse datetime value: {value}") from exc
 
 
+# Candidate keys are matched case-insensitively (a dict that looks like an item
+# but cannot be extracted prunes its children). Payload dicts come in a handful
+# of shapes, so the verdict is cached per key tuple instead of lowering every
+# key of every dict.
+_TITLE_KEYS = frozenset({"title", "headline", "name"})
+_URL_KEYS = frozenset({"url", "slug", "permalink", "path"})
+_DATE_KEYS = frozenset({"date", "published", "publishdate", "publishdatetime"})
+
+
+@functools.lru_cache(maxsize=1024)
+def _candidate_keys(keys: tuple[str, ...]) -> bool:
+    lowered = {key.lower() for key in keys}
+    return not (
+        lowered.isdisjoint(_TITLE_KEYS)
+        or lowered.isdisjoint(_URL_KEYS)
+        or lowered.isdisjoint(_DATE_KEYS)
+    )
+
+
 def _candidate_news_dict(obj: dict[str, Any]) -> bool:
-    lowered = {key.lower() for key in obj}
-    has_title = {"title", "headline", "name"} & lowered
-    has_url = {"url", "slug", "permalink", "path"} & lowered
-    has_date = {"date", "published", "publishdate", "publishdatetime"} & lowered
-    return bool(has_title and has_url and has_date)
+    return _candidate_keys(tuple(obj))
 
 
 def _build_identifier(obj: dict[str, Any]) -> str:
@@ -281,62 +433,82 @@ def _build_identifier(obj: dict[str, Any]) -> str:
     return f"{title.strip()}::{published.strip()}"
 
 
-def parse_news(html: str) -> tuple[list[NewsItem], dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
-    script = soup.find("script", id="__NEXT_DATA__")
-    if not script or not script.string:
+def _published_key(item: NewsItem) -> datetime:
+    return item.published
+
+
+def parse_news(
+    html: bytes, limit: int | None = None
+) -> tuple[list[NewsItem], dict[str, Any]]:
+    match = _NEXT_DATA_RE.search(html)
+    if not match or not match.group(1):
         raise FetchError("Could not locate Next.js data payload (__NEXT_DATA__).")
 
-    payload = json.loads(script.string)
-    items: list[NewsItem] = []
-
-    def walk(node: Any) -> None:
-        if isinstance(node, list):
-            for entry in node:
-                walk(entry)
-        elif isinstance(node, dict):
-            if _candidate_news_dict(node):
-                try:
-                    title = _extract_first(node, "title", "headline", "name")
-                    url_raw = _extract_first(node, "url", "permalink", "path", "slug")
-                    date_raw = _extract_first(
-                        node,
-                        "publishDateTime",
-                        "publishDate",
-                        "published",
-                        "date",
-                    )
-                    summary = _extract_first(node, "summary", "description", "standfirst")
-                    if not (title and url_raw and date_raw):
-                        return
-                    published = _parse_datetime(str(date_raw))
-                    identifier = _build_identifier(node)
-                    url = _normalise_url(str(url_raw))
-                    items.append(
-                        NewsItem(
+    payload = _json_loads(match.group(1))
+    unique: dict[str, NewsItem] = {}
+    # Next.js repeats the same entries in several props; an (identifier, raw
+    # date) pair seen before cannot replace the kept item, so skip it early.
+    seen: set[tuple[str, str]] = set()
+
+    # Iterative pre-order traversal; children are pushed in reverse so items
+    # are visited in document order, exactly like a recursive walk would.
+    stack: list[Any] = [payload]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is list:
+            stack.extend(reversed(node))
+            continue
+        if node_type is not dict:
+            continue
+        if _candidate_news_dict(node):
+            try:
+                title = _extract_first(node, "title", "headline", "name")
+                url_raw = _extract_first(node, "url", "permalink", "path", "slug")
+                date_raw = _extract_first(
+                    node,
+                    "publishDateTime",
+                    "publishDate",
+                    "published",
+                    "date",
+                )
+                if not (title and url_raw and date_raw):
+                    continue
+                identifier = sys.intern(_build_identifier(node))
+                key = (identifier, str(date_raw))
+                if key not in seen:
+                    seen.add(key)
+                    published = _parse_datetime(key[1])
+                    existing = unique.get(identifier)
+                    if existing is None or published > existing.published:
+                        summary = _extract_first(
+                            node, "summary", "description", "standfirst"
+                        )
+                        unique[identifier] = NewsItem(
                             identifier=identifier,
                             title=str(title).strip(),
-                            url=url,
+                            url=_normalise_url(str(url_raw)),
                             summary=(str(summary).strip() if summary else None),
                             published=published,
                         )
-                    )
-                except Exception as exc:  # noqa: BLE001 - log and continue
-                    LOGGER.debug("Failed to parse news item %s", node, exc_info=exc)
-            for value in node.values():
-                walk(value)
-
-    walk(payload)
-    unique: dict[str, NewsItem] = {}
-    for item in items:
-        if item.identifier not in unique or item.published > unique[item.identifier].published:
-            unique[item.identifier] = item
-    sorted_items = sorted(unique.values(), key=lambda item: item.published, reverse=True)
+            except Exception as exc:  # noqa: BLE001 - log and continue
+                LOGGER.debug("Failed to parse news item %s", node, exc_info=exc)
+        stack.extend(reversed(node.values()))
+
+    if limit is not None:
+        sorted_items = heapq.nlargest(limit, unique.values(), key=_published_key)
+    else:
+        sorted_items = sorted(unique.values(), key=_published_key, reverse=True)
     if not sorted_items:
         LOGGER.warning("No news entries were parsed from the payload.")
     return sorted_items, payload
 
 
-def fetch_news(timeout: int = 30) -> tuple[list[NewsItem], dict[str, Any]]:
-    html = fetch_news_html(timeout=timeout)
-    return parse_news(html)
+def fetch_news(
+    timeout: int = 30,
+    limit: int | None = None,
+    validators: dict[str, str] | None = None,
+) -> tuple[list[NewsItem], dict[str, Any], dict[str, str]]:
+    html, next_validators = fetch_news_html(timeout=timeout, validators=validators)
+    items, payload = parse_news(html, limit=limit)
+    return items, payload, next_validators
@@ -7,8 +7,8 @@ from pathlib import Path
 from typing import Optional
 
 from .discord import send_news
-from .scraper import FetchError, fetch_news
-from .storage import NewsArchive
+from .scraper import VALIDATOR_HEADERS, FetchError, NotModified, fetch_news
+from .storage import NewsArchive, isoformat_epoch
 
 LOGGER = logging.getLogger(__name__)
 
@@ -21,47 +21,95 @@ class MonitorService:
         poll_interval: int = 3600,
         dry_run: bool = False,
         ledger_path: Optional[str] = None,
+        item_limit: Optional[int] = None,
     ) -> None:
         self._webhook_url = webhook_url
         self._archive = NewsArchive(database_path)
         self._poll_interval = poll_interval
         self._dry_run = dry_run
         self._ledger_path = ledger_path
+        self._item_limit = item_limit
         if self._ledger_path:
             Path(self._ledger_path).parent.mkdir(parents=True, exist_ok=True)
 
     def run_once(self) -> int:
+        previous = self._load_validators()
         try:
-            items, payload = fetch_news()
+            items, payload, validators = fetch_news(
+                limit=self._item_limit, validators=previous
+            )
+        except NotModified:
+            LOGGER.info("News page unchanged since the last poll.")
+            return 0
         except FetchError as exc:
             LOGGER.error("Fetching news failed: %s", exc)
             raise
 
-        new_items = [item for item in items if not self._archive.has_item(item.identifier)]
+        known = self._archive.known_identifiers(item.identifier for item in items)
+        new_items = [item for item in items if item.identifier not in known]
         if new_items:
-            LOGGER.info("Identified %s new news item(s).", len(new_items))
-        else:
+            # RETURNING confirms what was stored, in case another writer got
+            # to some of the rows between the lookup and the insert.
+            inserted = set(self._archive.record_items(new_items, payload))
+            new_items = [item for item in new_items if item.identifier in inserted]
+        if not new_items:
+            # Everything is archived already; only remember the new validators.
             LOGGER.info("No new news items detected.")
+            self._store_validators(previous, validators)
+            return 0
 
-        self._archive.record_items(new_items or items, payload)
+        LOGGER.info("Identified %s new news item(s).", len(new_items))
 
         if self._ledger_path:
-            self._archive.export_ledger(self._ledger_path)
+            if not Path(self._ledger_path).is_file():
+                self._archive.export_ledger(self._ledger_path)
+            else:
+                self._archive.append_ledger(self._ledger_path, new_items)
+
+        self._store_validators(previous, validators)
 
-        if new_items and not self._dry_run:
+        if not self._dry_run:
             send_news(self._webhook_url, new_items)
-        elif new_items:
+        else:
             LOGGER.info("Dry run enabled - skipping Discord notification.")
         return len(new_items)
 
+    def _load_validators(self) -> dict[str, str]:
+        validators: dict[str, str] = {}
+        for name in VALIDATOR_HEADERS:
+            value = self._archive.get_meta(name)
+            if value:
+                validators[name] = value
+        return validators
+
+    def _store_validators(self, previous: dict[str, str], current: dict[str, str]) -> None:
+        for name in VALIDATOR_HEADERS:
+            if previous.get(name) != current.get(name):
+                self._archive.set_meta(name, current.get(name))
+
     def run_forever(self) -> None:
         LOGGER.info("Starting monitor loop with interval=%s seconds", self._poll_interval)
+        deadline = time.monotonic()
         while True:
+            deadline += self._poll_interval
             try:
                 self.run_once()
             except Exception as exc:  # noqa: BLE001 - log and continue loop
                 LOGGER.exception("Unexpected error during monitoring loop: %s", exc)
-            time.sleep(self._poll_interval)
+            now = time.monotonic()
+            if deadline < now:
+                # A poll overran the interval; start the next one right away but
+                # do not try to catch up on the missed slots.
+                deadline = now
+            time.sleep(deadline - now)
+
+    def rebuild_ledger(self) -> None:
+        if not self._ledger_path:
+            raise ValueError("No ledger path configured.")
+        self._archive.export_ledger(self._ledger_path)
 
     def dump_archive(self, limit: Optional[int] = None) -> list[str]:
-        return [f"{item.published.isoformat()} | {item.title} -> {item.url}" for item in self._archive.fetch_archive(limit)]
+        return [
+            f"{isoformat_epoch(published)} | {title} -> {url}"
+            for _, title, url, _, published, _ in self._archive.iter_archive(limit)
+        ]
@@ -2,136 +2,598 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+import functools
+from itertools import islice
 import json
+import os
 from pathlib import Path
+import queue
 import sqlite3
-from typing import Generator, Iterable, Optional
+import threading
+import time
+from typing import Generator, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency at runtime
+    orjson = None
 
 from .types import NewsItem
 
 
 _SCHEMA = """
+-- One row per fetched payload that contributed new items; news rows point at
+-- it instead of each carrying their own copy of the (large) JSON blob.
+CREATE TABLE IF NOT EXISTS news_sources (
+    id INTEGER PRIMARY KEY,
+    fetched_at INTEGER NOT NULL,
+    raw_json TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS news (
     identifier TEXT PRIMARY KEY,
     title TEXT NOT NULL,
     url TEXT NOT NULL,
     summary TEXT,
-    published TEXT NOT NULL,
+    published INTEGER NOT NULL,
+    retrieved_at INTEGER NOT NULL,
+    source_id INTEGER REFERENCES news_sources (id)
+);
+
+-- identifier is the PRIMARY KEY and already has its own unique index. Adding
+-- it to the published index makes latest_identifier() a covering index read.
+DROP INDEX IF EXISTS idx_news_published;
+CREATE INDEX IF NOT EXISTS idx_news_published_identifier
+    ON news (published DESC, identifier);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Archives created before ``published`` became unix seconds stored it as ISO
+# text; rebuild the table once, letting SQLite convert the values.
+_MIGRATE_PUBLISHED_TO_EPOCH = """
+BEGIN IMMEDIATE;
+CREATE TABLE news_migrated (
+    identifier TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    summary TEXT,
+    published INTEGER NOT NULL,
     retrieved_at TEXT NOT NULL,
     raw_json TEXT
 );
+INSERT INTO news_migrated (identifier, title, url, summary, published, retrieved_at, raw_json)
+SELECT identifier, title, url, summary, CAST(strftime('%s', published) AS INTEGER), retrieved_at, raw_json
+FROM news;
+DROP TABLE news;
+ALTER TABLE news_migrated RENAME TO news;
+COMMIT;
+"""
+
+# Archives that stored the payload inline in news.raw_json: deduplicate the
+# blobs into news_sources and point each row at its source instead.
+_MIGRATE_RAW_JSON_TO_SOURCES = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS news_sources (
+    id INTEGER PRIMARY KEY,
+    fetched_at TEXT NOT NULL,
+    raw_json TEXT NOT NULL
+);
+INSERT INTO news_sources (fetched_at, raw_json)
+SELECT MIN(retrieved_at), raw_json FROM news WHERE raw_json IS NOT NULL GROUP BY raw_json;
+ALTER TABLE news ADD COLUMN source_id INTEGER REFERENCES news_sources (id);
+UPDATE news
+SET source_id = (SELECT id FROM news_sources WHERE news_sources.raw_json = news.raw_json)
+WHERE raw_json IS NOT NULL;
+ALTER TABLE news DROP COLUMN raw_json;
+COMMIT;
+"""
+
+# Archives that stored retrieved_at / fetched_at as ISO text. Both tables are
+# rebuilt because a TEXT column would turn the integers back into strings.
+_MIGRATE_RETRIEVED_AT_TO_EPOCH = """
+BEGIN IMMEDIATE;
+CREATE TABLE news_sources_migrated (
+    id INTEGER PRIMARY KEY,
+    fetched_at INTEGER NOT NULL,
+    raw_json TEXT NOT NULL
+);
+INSERT INTO news_sources_migrated (id, fetched_at, raw_json)
+SELECT id, CAST(strftime('%s', fetched_at) AS INTEGER), raw_json FROM news_sources;
+DROP TABLE news_sources;
+ALTER TABLE news_sources_migrated RENAME TO news_sources;
+CREATE TABLE news_migrated (
+    identifier TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    summary TEXT,
+    published INTEGER NOT NULL,
+    retrieved_at INTEGER NOT NULL,
+    source_id INTEGER REFERENCES news_sources (id)
+);
+INSERT INTO news_migrated (identifier, title, url, summary, published, retrieved_at, source_id)
+SELECT identifier, title, url, summary, published, CAST(strftime('%s', retrieved_at) AS INTEGER), source_id
+FROM news;
+DROP TABLE news;
+ALTER TABLE news_migrated RENAME TO news;
+COMMIT;
+"""
+
+# Per-connection settings: WAL makes fsyncs rare enough that NORMAL
+# synchronous mode is still crash-safe for the archive.
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=5000;
 """
 
+_MEMORY_PATH = ":memory:"
+
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older builds).
+_LOOKUP_CHUNK_SIZE = 500
+
+# Rows per multi-row INSERT; six bound values each keeps the statement under
+# the same variable limit while bounding memory for large feeds.
+_INSERT_BATCH_SIZE = 128
+
+# Rows pulled per fetchmany() while streaming the archive.
+_FETCH_BATCH_SIZE = 1000
+
+# Row batches buffered between the ledger export's reader and writer threads.
+_EXPORT_QUEUE_SIZE = 8
+# Ledger lines are gathered into chunks of this size before hitting the
+# (large, binary) file buffer.
+_LEDGER_BUFFER_SIZE = 1 << 20
+_LEDGER_FLUSH_SIZE = 256 * 1024
+
+ArchiveRow = tuple[str, str, str, Optional[str], int, int]
+
+
+@functools.lru_cache(maxsize=_INSERT_BATCH_SIZE)
+def _insert_news_sql(row_count: int) -> str:
+    # sqlite3 drops rows produced by executemany(), so new identifiers are
+    # collected through RETURNING on a multi-row VALUES insert instead.
+    values = ", ".join(["(?, ?, ?, ?, ?, ?)"] * row_count)
+    return (
+        "INSERT INTO news (identifier, title, url, summary, published, retrieved_at)"
+        f" VALUES {values}"
+        " ON CONFLICT (identifier) DO NOTHING RETURNING identifier"
+    )
+
+
+def _from_epoch(value: int) -> datetime:
+    return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
+def isoformat_epoch(value: int) -> str:
+    """Format stored unix seconds as a naive UTC ISO-8601 string."""
+
+    # gmtime + strftime runs in C and avoids building a datetime per row.
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(value))
+
+
+# sqlite3 keeps compiled statements in a per-connection LRU keyed by the SQL
+# text. The archive's connections are long-lived, so the hot queries live here
+# as constants to always hit that cache.
+
+_SQL_ITER_ARCHIVE = (
+    "SELECT identifier, title, url, summary, published, retrieved_at"
+    " FROM news ORDER BY published DESC"
+)
+# Ledger rows come back with the timestamps already formatted by SQLite so
+# each row maps straight onto _LEDGER_KEYS.
+_LEDGER_KEYS = ("identifier", "title", "url", "summary", "published", "retrieved_at")
+_SQL_LEDGER_COLUMNS = (
+    "identifier, title, url, summary,"
+    " strftime('%Y-%m-%dT%H:%M:%S', published, 'unixepoch'),"
+    " strftime('%Y-%m-%dT%H:%M:%S', retrieved_at, 'unixepoch')"
+)
+_SQL_EXPORT_LEDGER = f"SELECT {_SQL_LEDGER_COLUMNS} FROM news ORDER BY published DESC"
+_SQL_LEDGER_ROWS_BY_ID = (
+    f"SELECT {_SQL_LEDGER_COLUMNS} FROM news WHERE identifier IN ({{placeholders}})"
+)
+_SQL_KNOWN_IDENTIFIERS = "SELECT identifier FROM news WHERE identifier IN ({placeholders})"
+_SQL_SET_SOURCE_ID = "UPDATE news SET source_id = ? WHERE identifier IN ({placeholders})"
+_SQL_HAS_ITEM = "SELECT EXISTS (SELECT 1 FROM news WHERE identifier = ?)"
+_SQL_LATEST_IDENTIFIER = "SELECT identifier FROM news ORDER BY published DESC LIMIT 1"
+_SQL_INSERT_SOURCE = "INSERT INTO news_sources (fetched_at, raw_json) VALUES (?, ?)"
+_SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+_SQL_SET_META = """
+INSERT INTO meta (key, value) VALUES (?, ?)
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+_SQL_DELETE_META = "DELETE FROM meta WHERE key = ?"
+
+# The newest identifier is cached in meta by record_items so that
+# latest_identifier() is a single primary-key lookup. It is recomputed from
+# the index rather than taken from the batch, which may hold older items.
+_META_LATEST_IDENTIFIER = "latest_identifier"
+_SQL_REFRESH_LATEST_IDENTIFIER = f"""
+INSERT INTO meta (key, value)
+SELECT '{_META_LATEST_IDENTIFIER}', identifier FROM news WHERE true
+ORDER BY published DESC LIMIT 1
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+
+def _json_bytes(obj: object) -> bytes:
+    """Serialise ``obj`` to compact UTF-8 JSON, preferring orjson."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # e.g. lone surrogates that the stdlib decoder let through.
+            pass
+    try:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    except UnicodeEncodeError:
+        # Surrogates have no UTF-8 form; ASCII output escapes them as \udXXX.
+        return json.dumps(obj, separators=(",", ":")).encode("ascii")
+
+
+def _execute_in_chunks(
+    conn: sqlite3.Connection, sql: str, identifiers: list[str], *prefix: object
+) -> list[tuple]:
+    """Run ``sql`` once per chunk of ``identifiers`` and collect the rows.
+
+    ``sql`` carries an ``{placeholders}`` slot for the ``IN`` list; ``prefix``
+    values are bound ahead of each chunk.
+    """
+
+    rows: list[tuple] = []
+    for idx in range(0, len(identifiers), _LOOKUP_CHUNK_SIZE):
+        chunk = identifiers[idx : idx + _LOOKUP_CHUNK_SIZE]
+        query = sql.format(placeholders=",".join("?" * len(chunk)))
+        rows.extend(conn.execute(query, [*prefix, *chunk]).fetchall())
+    return rows
+
 
 class NewsArchive:
     """Lightweight wrapper around SQLite for persisting news items."""
 
+    # Resolved paths whose schema and migrations were already applied by this
+    # process; reopening such an archive only needs the connection pragmas.
+    _initialized: set[str] = set()
+    _initialized_lock = threading.Lock()
+
     def __init__(self, path: str) -> None:
-        db_path = Path(path)
-        parent = db_path.parent
-        if parent != Path("."):
-            parent.mkdir(parents=True, exist_ok=True)
-        self._path = str(db_path)
+        self._in_memory = path == _MEMORY_PATH
+        self._schema_key: Optional[str] = None
+        if self._in_memory:
+            self._path = path
+        else:
+            db_path = Path(path)
+            if not db_path.exists():
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                # The file is (re)created from scratch, so forget any earlier setup.
+                with NewsArchive._initialized_lock:
+                    NewsArchive._initialized.discard(str(db_path.resolve()))
+            self._path = str(db_path)
+            self._schema_key = str(db_path.resolve())
+        # Single writer in autocommit mode; transactions are opened explicitly
+        # by _transaction() and every use holds _lock. Reads go through a pool
+        # of read-only connections so WAL lets them run alongside writes.
+        self._writer: Optional[sqlite3.Connection] = sqlite3.connect(
+            self._path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
         self._ensure_schema()
 
+    def close(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        self._close_readers()
+
+    def __del__(self) -> None:
+        writer = getattr(self, "_writer", None)
+        if writer is not None:
+            writer.close()
+        if hasattr(self, "_readers"):
+            self._close_readers()
+
+    def _close_readers(self) -> None:
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
     @contextmanager
-    def _conn(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(self._path)
+    def _writer_conn(self) -> Generator[sqlite3.Connection, None, None]:
+        with self._lock:
+            if self._writer is None:
+                raise sqlite3.ProgrammingError("NewsArchive has been closed.")
+            yield self._writer
+
+    @contextmanager
+    def _reader(self) -> Generator[sqlite3.Connection, None, None]:
+        if self._in_memory:
+            # A private in-memory database cannot be opened a second time.
+            with self._writer_conn() as conn:
+                yield conn
+            return
+        if self._writer is None:
+            raise sqlite3.ProgrammingError("NewsArchive has been closed.")
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
         try:
             yield conn
         finally:
-            conn.close()
+            # Checked under the lock so a concurrent close() either drains
+            # this connection from the pool or we close it here.
+            with self._lock:
+                closed = self._writer is None
+                if not closed:
+                    self._readers.put(conn)
+            if closed:
+                conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection, None, None]:
+        with self._writer_conn() as conn:
+            # IMMEDIATE takes the write lock up front instead of upgrading a
+            # read transaction later, which could fail with SQLITE_BUSY.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def _ensure_schema(self) -> None:
-        with self._conn() as conn:
-            conn.execute("PRAGMA journal_mode=WAL;")
-            conn.execute(_SCHEMA)
-            conn.commit()
+        with self._writer_conn() as conn:
+            conn.executescript(_CONNECTION_PRAGMAS)
+            if self._schema_key in NewsArchive._initialized:
+                return
+            if not self._in_memory:
+                # journal_mode is persisted in the database file itself.
+                conn.execute("PRAGMA journal_mode=WAL;")
+            columns = {
+                name: declared.upper()
+                for _, name, declared, *_ in conn.execute("PRAGMA table_info(news)")
+            }
+            # Migrations run oldest first; each keeps the columns it does not
+            # touch, so ``columns`` stays valid for the later checks.
+            if columns.get("published") == "TEXT":
+                conn.executescript(_MIGRATE_PUBLISHED_TO_EPOCH)
+            if "raw_json" in columns:
+                conn.executescript(_MIGRATE_RAW_JSON_TO_SOURCES)
+            if columns.get("retrieved_at") == "TEXT":
+                conn.executescript(_MIGRATE_RETRIEVED_AT_TO_EPOCH)
+            conn.executescript(_SCHEMA)
+        if self._schema_key is not None:
+            with NewsArchive._initialized_lock:
+                NewsArchive._initialized.add(self._schema_key)
 
-    def latest_identifier(self) -> Optional[str]:
-        with self._conn() as conn:
-            cur = conn.execute(
-                "SELECT identifier FROM news ORDER BY published DESC LIMIT 1"
-            )
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._reader() as conn:
+            cur = conn.execute(_SQL_GET_META, (key,))
             row = cur.fetchone()
             return row[0] if row else None
 
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        """Store ``value`` under ``key``; ``None`` removes the entry."""
+
+        with self._writer_conn() as conn:
+            if value is None:
+                conn.execute(_SQL_DELETE_META, (key,))
+            else:
+                conn.execute(_SQL_SET_META, (key, value))
+
+    def latest_identifier(self) -> Optional[str]:
+        with self._reader() as conn:
+            row = conn.execute(_SQL_GET_META, (_META_LATEST_IDENTIFIER,)).fetchone()
+            if row is None:
+                # Archives written before the value was cached in meta.
+                row = conn.execute(_SQL_LATEST_IDENTIFIER).fetchone()
+            return row[0] if row else None
+
     def has_item(self, identifier: str) -> bool:
-        with self._conn() as conn:
-            cur = conn.execute(
-                "SELECT 1 FROM news WHERE identifier = ? LIMIT 1", (identifier,)
-            )
-            return cur.fetchone() is not None
-
-    def record_items(self, items: Iterable[NewsItem], raw_source: Optional[dict] = None) -> None:
-        payload = json.dumps(raw_source, ensure_ascii=False) if raw_source else None
-        now = datetime.utcnow().isoformat(timespec="seconds")
-        with self._conn() as conn:
-            for item in items:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO news (identifier, title, url, summary, published, retrieved_at, raw_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (*item.to_row(), now, payload),
+        with self._reader() as conn:
+            cur = conn.execute(_SQL_HAS_ITEM, (identifier,))
+            return bool(cur.fetchone()[0])
+
+    def known_identifiers(self, identifiers: Iterable[str]) -> set[str]:
+        """Return the subset of ``identifiers`` that is already archived."""
+
+        pending = list(dict.fromkeys(identifiers))
+        with self._reader() as conn:
+            rows = _execute_in_chunks(conn, _SQL_KNOWN_IDENTIFIERS, pending)
+        return {row[0] for row in rows}
+
+    def record_items(
+        self, items: Iterable[NewsItem], raw_source: Optional[dict] = None
+    ) -> list[str]:
+        """Archive ``items`` and return the identifiers that were newly stored.
+
+        Items whose identifier is already archived are left untouched.
+        """
+
+        now = int(time.time())
+        rows = ((*item.to_row(), now) for item in items)
+        inserted: list[str] = []
+        batch = list(islice(rows, _INSERT_BATCH_SIZE))
+        if not batch:
+            return inserted
+        with self._transaction() as conn:
+            while batch:
+                cur = conn.execute(
+                    _insert_news_sql(len(batch)),
+                    [value for row in batch for value in row],
                 )
-            conn.commit()
+                inserted.extend(row[0] for row in cur)
+                batch = list(islice(rows, _INSERT_BATCH_SIZE))
+            if inserted:
+                conn.execute(_SQL_REFRESH_LATEST_IDENTIFIER)
 
-    def fetch_archive(self, limit: Optional[int] = None) -> list[NewsItem]:
-        query = "SELECT identifier, title, url, summary, published FROM news ORDER BY published DESC"
+            # Only pay for serialising the payload if something was stored.
+            if inserted and raw_source:
+                cur = conn.execute(
+                    _SQL_INSERT_SOURCE,
+                    (now, _json_bytes(raw_source).decode("utf-8")),
+                )
+                _execute_in_chunks(conn, _SQL_SET_SOURCE_ID, inserted, cur.lastrowid)
+        return inserted
+
+    def iter_archive(self, limit: Optional[int] = None) -> Iterator[ArchiveRow]:
+        """Yield raw archive rows, newest first, without building NewsItems.
+
+        Rows are ``(identifier, title, url, summary, published, retrieved_at)``
+        with both timestamps as UTC unix seconds (see :func:`isoformat_epoch`).
+        """
+
+        query = _SQL_ITER_ARCHIVE
         if limit is not None:
             query += " LIMIT ?"
             params: tuple[object, ...] = (limit,)
         else:
             params = ()
+        return self._iter_query(query, params)
 
-        with self._conn() as conn:
+    def _iter_query(self, query: str, params: tuple[object, ...] = ()) -> Iterator[tuple]:
+        if self._in_memory:
+            with self._writer_conn() as conn:
+                cur = conn.execute(query, params)
+            # The shared connection's lock is only held per batch so callers
+            # may use the archive while iterating.
+            while True:
+                with self._writer_conn():
+                    rows = cur.fetchmany(_FETCH_BATCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+
+        with self._reader() as conn:
             cur = conn.execute(query, params)
-            rows = cur.fetchall()
-
-        items: list[NewsItem] = []
-        for identifier, title, url, summary, published in rows:
-            items.append(
-                NewsItem(
-                    identifier=identifier,
-                    title=title,
-                    url=url,
-                    summary=summary,
-                    published=datetime.fromisoformat(published),
-                )
+            while True:
+                rows = cur.fetchmany(_FETCH_BATCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+
+    def fetch_archive(self, limit: Optional[int] = None) -> list[NewsItem]:
+        from_epoch = _from_epoch
+        return [
+            NewsItem(
+                identifier=identifier,
+                title=title,
+                url=url,
+                summary=summary,
+                published=from_epoch(published),
             )
-        return items
+            for identifier, title, url, summary, published, _ in self.iter_archive(limit)
+        ]
 
     def export_ledger(self, path: str) -> None:
         """Write the full archive to a JSONL ledger for human inspection."""
 
-        with self._conn() as conn:
-            cur = conn.execute(
-                """
-                SELECT identifier, title, url, summary, published, retrieved_at
-                FROM news
-                ORDER BY published DESC
-                """
-            )
-            rows = cur.fetchall()
-
+        # A reader thread streams row batches from a pooled connection while
+        # this thread encodes them, overlapping SQLite reads with JSON work.
+        batches: queue.Queue = queue.Queue(maxsize=_EXPORT_QUEUE_SIZE)
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._produce_ledger_rows,
+            args=(batches, stop),
+            name="ledger-export",
+            daemon=True,
+        )
+        # The rows stream into a sibling temp file that only replaces the
+        # ledger once complete, so a failed export leaves the old one intact.
         ledger_path = Path(path)
-        ledger_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with ledger_path.open("w", encoding="utf-8") as handle:
-            for identifier, title, url, summary, published, retrieved_at in rows:
-                handle.write(
-                    json.dumps(
-                        {
-                            "identifier": identifier,
-                            "title": title,
-                            "url": url,
-                            "summary": summary,
-                            "published": published,
-                            "retrieved_at": retrieved_at,
-                        },
-                        ensure_ascii=False,
-                    )
-                    + "\n"
-                )
+        tmp_path = ledger_path.with_name(ledger_path.name + ".tmp")
+        reader.start()
+        try:
+            _write_ledger(str(tmp_path), _drain_batches(batches), mode="wb")
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            stop.set()
+            # Unblock the reader if the writer bailed out with batches queued.
+            while reader.is_alive():
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            reader.join()
+        os.replace(tmp_path, ledger_path)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = Path(self._path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+        )
+        conn.executescript(_CONNECTION_PRAGMAS)
+        conn.execute("PRAGMA query_only=1;")
+        return conn
+
+    def _produce_ledger_rows(self, batches: queue.Queue, stop: threading.Event) -> None:
+        try:
+            rows = self._iter_query(_SQL_EXPORT_LEDGER)
+            while not stop.is_set():
+                batch = list(islice(rows, _FETCH_BATCH_SIZE))
+                if not batch:
+                    break
+                batches.put(batch)
+            rows.close()
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the writer
+            batches.put(exc)
+            return
+        batches.put(None)
+
+    def append_ledger(self, path: str, items: Iterable[NewsItem]) -> None:
+        """Append the archived rows of ``items`` to an existing JSONL ledger."""
+
+        pending = list(dict.fromkeys(item.identifier for item in items))
+        if not pending:
+            return
+
+        with self._reader() as conn:
+            rows = _execute_in_chunks(conn, _SQL_LEDGER_ROWS_BY_ID, pending)
+        # Fixed-width ISO strings sort the same way as the epoch values.
+        rows.sort(key=lambda row: row[4], reverse=True)
+
+        _write_ledger(path, rows, mode="ab")
+
+
+def _drain_batches(batches: queue.Queue) -> Iterator[tuple]:
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        if isinstance(batch, BaseException):
+            raise batch
+        yield from batch
+
+
+def _write_ledger(path: str, rows: Iterable[tuple], mode: str) -> None:
+    ledger_path = Path(path)
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(ledger_path, mode, buffering=_LEDGER_BUFFER_SIZE) as handle:
+        buffer = bytearray()
+        keys = _LEDGER_KEYS
+        for row in rows:
+            buffer += _json_bytes(dict(zip(keys, row)))
+            buffer += b"\n"
+            if len(buffer) >= _LEDGER_FLUSH_SIZE:
+                handle.write(buffer)
+                buffer.clear()
+        if buffer:
+            handle.write(buffer)
@@ -1,12 +1,13 @@
 """Core datatypes for the Marcel Schneider news monitor."""
 from __future__ import annotations
 
+import calendar
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewsItem:
     """A single news entry sourced from europeantour.com."""
 
@@ -16,12 +17,16 @@ class NewsItem:
     published: datetime
     summary: Optional[str] = None
 
-    def to_row(self) -> tuple[str, str, str, Optional[str], str]:
-        """Return a tuple suitable for SQLite insertion."""
+    def to_row(self) -> tuple[str, str, str, Optional[str], int]:
+        """Return a tuple suitable for SQLite insertion.
+
+        ``published`` is stored as UTC unix seconds; naive datetimes are
+        treated as UTC.
+        """
         return (
             self.identifier,
             self.title,
             self.url,
             self.summary,
-            self.published.isoformat(timespec="seconds"),
+            calendar.timegm(self.published.utctimetuple()),
         )